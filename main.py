@@ -11,7 +11,25 @@ from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 
 
-def scrape_table_from_website(url: str):
+def create_driver():
+    """
+    Starts a headless Chrome driver for scraping.
+
+    Returns
+    -------
+    webdriver.Chrome
+        A driver that can be reused across many pages; call quit() when done.
+    """
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+
+    return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+
+
+def scrape_table_from_website(url: str, driver=None):
     """
     Scrapes the first HTML table found on a webpage using Selenium
     and saves it as a CSV file inside the 'output' folder, 
@@ -21,6 +39,9 @@ def scrape_table_from_website(url: str):
     ----------
     url : str
         The URL of the webpage containing the table.
+    driver : webdriver.Chrome, optional
+        An existing driver to reuse. If omitted, a driver is started
+        for this page and closed afterwards.
     """
 
     # --- Create output folder ---
@@ -34,13 +55,10 @@ def scrape_table_from_website(url: str):
     safe_page_name = re.sub(r'[^a-zA-Z0-9_-]', '_', page_name)
     output_csv = os.path.join(output_folder, f"{domain}_{safe_page_name}.csv")
 
-    # --- Setup Chrome (headless mode) ---
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
-
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    # --- Setup Chrome (headless mode) unless the caller shares one ---
+    owns_driver = driver is None
+    if owns_driver:
+        driver = create_driver()
 
     try:
         print(f"\n🌐 Accessing: {url}")
@@ -81,8 +99,9 @@ def scrape_table_from_website(url: str):
         print(f"⚠️ Error scraping {url}: {e}")
 
     finally:
-        driver.quit()
-        print("🧹 Browser closed.")
+        if owns_driver:
+            driver.quit()
+            print("🧹 Browser closed.")
 
 
 if __name__ == "__main__":
@@ -96,5 +115,11 @@ if __name__ == "__main__":
         "https://versionsof.net/core/8.0/8.0.0/",
     ]
 
-    for link in urls:
-        scrape_table_from_website(link)
\ No newline at end of file
+    # Start Chrome once and reuse it for every page
+    shared_driver = create_driver()
+    try:
+        for link in urls:
+            scrape_table_from_website(link, shared_driver)
+    finally:
+        shared_driver.quit()
+        print("🧹 Browser closed.")
\ No newline at end of file
@@ -11,21 +11,39 @@ Features:
 """
 
 import csv
+import gzip
+import hashlib
+import io
 import json
 import logging
 import asyncio
 import aiofiles
 import sys
 import os
+import atexit
+import queue
+import threading
+import warnings
+import shutil
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union, Tuple
+from contextlib import ExitStack
+from collections import Counter, defaultdict
+from functools import lru_cache, partial
+from typing import Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Union, Tuple
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from urllib.parse import urlparse
+from urllib.parse import urlparse as _urlparse, urlsplit, urlunsplit
 import re
 import time
+from itertools import count, islice
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
+from lxml.html import soupparser
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service as ChromeService
@@ -35,6 +53,23 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from webdriver_manager.chrome import ChromeDriverManager
 
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    from hishel import AsyncSqliteStorage, SyncSqliteStorage
+    from hishel.httpx import AsyncCacheClient, SyncCacheClient
+    HTTP_CACHE_AVAILABLE = True
+except ImportError:
+    HTTP_CACHE_AVAILABLE = False
+
+# The same URLs are parsed by the page parser, the per-host request limits and the
+# summary report; ParseResult is an immutable namedtuple, so results can be shared
+urlparse = lru_cache(maxsize=4096)(_urlparse)
+
 # ==============================================================================
 # 0. CONFIGURATION - SINGLE PLACE TO ADD/MODIFY URLs
 # ==============================================================================
@@ -48,7 +83,7 @@ SCRAPING_URLS = [
 
 # Output configuration
 DEFAULT_OUTPUT_FILENAME = "software_versions_data"
-USE_ASYNC_MODE = False
+USE_ASYNC_MODE = True  # Fetch all URLs concurrently with httpx.AsyncClient
 
 # Enhanced scraping configuration
 SCRAPING_CONFIG = {
@@ -62,6 +97,14 @@ SCRAPING_CONFIG = {
     'retry_attempts': 5,
     'retry_delay': 3,
     'min_content_length': 5,  # Minimum characters for valid content
+    'html_parser': 'lxml',  # BeautifulSoup builder used when lxml cannot parse a page
+    'write_buffer_bytes': 1024 * 1024,  # Buffer size for every output CSV file
+    'compress_output': False,  # Write gzip-compressed .csv.gz files instead of plain CSV
+    'http_cache_path': 'httpx_cache.db',  # Response cache for revalidating re-runs (needs hishel); None disables
+}
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
 }
 
 # ==============================================================================
@@ -80,26 +123,59 @@ class ParseException(ScraperException):
 class ExportException(ScraperException):
     pass
 
+_MAX_CONNECTIONS_DEPRECATED = "ScraperConfig.max_connections is deprecated, use max_concurrency"
+
 class ScraperConfig:
-    def __init__(self):
+    def __init__(self, max_connections: Optional[int] = None):
         self.timeout = SCRAPING_CONFIG['timeout']
         self.retry_attempts = SCRAPING_CONFIG['retry_attempts']
         self.retry_delay = SCRAPING_CONFIG['retry_delay']
-        self.max_connections = 10
+        self.max_concurrency = 10  # Requests in flight at once (async mode)
+        self.per_host_limit = 4  # Requests in flight at once to any one host (async mode)
+        self.parse_workers = os.cpu_count() or 1
         self.chrome_options = [
             "--headless", "--no-sandbox", "--disable-dev-shm-usage",
             "--disable-gpu", "--window-size=1920,1080",
             "--disable-blink-features=AutomationControlled",
+            "--blink-settings=imagesEnabled=false",
             "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         ]
         self.valid_domains = []
         self.max_content_size = SCRAPING_CONFIG['max_content_length']
+        self.write_buffer_bytes = SCRAPING_CONFIG['write_buffer_bytes']
+        self.compress_output = SCRAPING_CONFIG['compress_output']
+        self.http_cache_path = SCRAPING_CONFIG['http_cache_path']
+        if max_connections is not None:
+            warnings.warn(_MAX_CONNECTIONS_DEPRECATED, DeprecationWarning, stacklevel=2)
+            self.max_concurrency = max_connections
+    
+    @property
+    def max_connections(self) -> int:
+        """Deprecated alias of max_concurrency, the setting's former name."""
+        warnings.warn(_MAX_CONNECTIONS_DEPRECATED, DeprecationWarning, stacklevel=2)
+        return self.max_concurrency
+    
+    @max_connections.setter
+    def max_connections(self, value: int):
+        warnings.warn(_MAX_CONNECTIONS_DEPRECATED, DeprecationWarning, stacklevel=2)
+        self.max_concurrency = value
 
 # ==============================================================================
 # 2. ENHANCED LOGGING SYSTEM
 # ==============================================================================
 
+# Message markers, defined once rather than as literals at every log call
+EMOJI_SUCCESS = "✅"
+EMOJI_FAILURE = "❌"
+EMOJI_START = "🚀"
+EMOJI_FETCH = "🔄"
+EMOJI_BROWSER = "🌐"
+
 class ScraperLogger:
+    """
+    Console and file logger. Messages take %-style args, formatted only if the
+    record is actually emitted.
+    """
     def __init__(self, name: str = "WebScraper", log_file: str = "scraper.log"):
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.INFO)
@@ -118,17 +194,130 @@ class ScraperLogger:
             self.logger.addHandler(console_handler)
             self.logger.addHandler(file_handler)
     
-    def info(self, message: str): self.logger.info(message)
-    def error(self, message: str, exc_info: bool = True): self.logger.error(message, exc_info=exc_info)
-    def warning(self, message: str): self.logger.warning(message)
-    def debug(self, message: str): self.logger.debug(message)
-    def success(self, message: str): self.logger.info(f"✅ {message}")
-    def failure(self, message: str): self.logger.error(f"❌ {message}")
+    def info(self, message: str, *args): self.logger.info(message, *args)
+    def error(self, message: str, *args, exc_info: bool = True): self.logger.error(message, *args, exc_info=exc_info)
+    def warning(self, message: str, *args): self.logger.warning(message, *args)
+    def debug(self, message: str, *args): self.logger.debug(message, *args)
+    
+    def success(self, message: str, *args):
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"{EMOJI_SUCCESS} {message}", *args)
+    
+    def failure(self, message: str, *args):
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(f"{EMOJI_FAILURE} {message}", *args)
 
 # ==============================================================================
 # 3. ENHANCED DATA PARSER WITH BETTER STRUCTURE
 # ==============================================================================
 
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+# Elements the extractors read (with their subtrees); BeautifulSoup fallback keeps only these
+CONTENT_TAGS = ('table', 'caption', 'ul', 'ol', *HEADING_TAGS, 'p', 'strong', 'b')
+
+# Subtrees that never hold extractable text, dropped right after parsing
+_NON_CONTENT_TAGS = ('script', 'style', 'noscript', 'template', 'svg')
+
+# Text-cleaning patterns, compiled once at import
+_WS_RE = re.compile(r'\s+')
+_CTRL_RE = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+_CITE_RE = re.compile(r'\[\d+\]')  # Citation markers [1], [2], etc.
+_DOT_RE = re.compile(r'\s*\.\s*')
+_WORD_RE = re.compile(r'\b[a-zA-Z]{2,}\b')
+
+# Common version patterns fused into one alternation; the group name is the version kind.
+# The month branch is guarded by a first-letter lookahead so most words fail on one char.
+_VERSION_RE = re.compile(
+    r'(?P<semver>\bv?\d+\.\d+\.\d+[a-zA-Z]?\b)'  # 1.2.3, v1.2.3 or 1.2.3a
+    r'|(?P<short>\b\d+\.\d+\b)'  # 1.2
+    r'|(?P<iso>\b\d{4}-\d{2}-\d{2}\b)'  # 2024-01-01
+    r'|(?P<month>\b(?=[ADFJMNOS][a-z])'
+    r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\b)'
+)
+
+# Every version pattern needs a digit; texts without one skip the full scan
+_DIGIT_RE = re.compile(r'\d')
+
+# Table structure selectors, compiled once. Only the table's own rows are selected;
+# nested tables are visited separately by the document walk.
+_TABLE_ROWS_XP = etree.XPath('tr | thead/tr | tbody/tr | tfoot/tr')
+_HEAD_CELLS_XP = etree.XPath('thead/tr/*[self::th or self::td]')
+_BODY_ROWS_XP = etree.XPath('tbody/tr')
+
+def _is_valid_content(text: str, min_length: int) -> bool:
+    """
+    Check if content meets minimum quality standards: long enough and containing a
+    word (not just symbols or numbers). The length test rejects most strings, so it
+    runs first; per-cell and per-item loops inline it before calling.
+    """
+    return len(text) >= min_length and _WORD_RE.search(text) is not None
+
+# Element tag -> element_type used for version records
+VERSION_ELEMENT_TYPES = {
+    'table': 'table',
+    'ul': 'list', 'ol': 'list',
+    **{tag: 'heading' for tag in HEADING_TAGS},
+    'p': 'paragraph',
+}
+
+# Elements whose text labels the lists that follow them
+_CONTEXT_TAGS = (*HEADING_TAGS, 'strong', 'b')
+
+# Every element the single document walk dispatches on
+_WALK_TAGS = (*VERSION_ELEMENT_TYPES, 'strong', 'b')
+
+@dataclass
+class ScrapedRecord:
+    """Fields shared by every extracted record."""
+    __slots__ = ('record_id', 'extraction_timestamp', 'source_url', 'domain')
+    record_id: str
+    extraction_timestamp: str
+    source_url: str
+    domain: str
+    data_type: ClassVar[str] = 'unknown'
+
+@dataclass
+class TableRecord(ScrapedRecord):
+    """One table data row; cells holds (column name, text) pairs."""
+    __slots__ = ('table_context', 'row_index', 'cells')
+    table_context: str
+    row_index: int
+    cells: Tuple[Tuple[str, str], ...]
+    data_type: ClassVar[str] = 'table_data'
+
+@dataclass
+class ListRecord(ScrapedRecord):
+    """One item of an ordered or unordered list."""
+    __slots__ = ('list_context', 'item_index', 'content', 'list_type', 'total_items')
+    list_context: str
+    item_index: int
+    content: str
+    list_type: str
+    total_items: int
+    data_type: ClassVar[str] = 'list_item'
+
+@dataclass
+class SectionRecord(ScrapedRecord):
+    """Content collected under a heading."""
+    __slots__ = ('heading', 'heading_level', 'content', 'content_pieces')
+    heading: str
+    heading_level: str
+    content: str
+    content_pieces: int
+    data_type: ClassVar[str] = 'section_content'
+
+@dataclass
+class VersionRecord(ScrapedRecord):
+    """A version number or release date found in an element's text."""
+    __slots__ = ('version_number', 'version_kind', 'context', 'element_type', 'full_text')
+    version_number: str
+    version_kind: str
+    context: str
+    element_type: str
+    full_text: str
+    data_type: ClassVar[str] = 'version_info'
+
 class StructuredDataParser:
     """
     Enhanced parser that creates well-structured, organized data for CSV.
@@ -138,284 +327,286 @@ class StructuredDataParser:
         if not html_content:
             raise ValueError("HTML content cannot be empty.")
         
-        self.soup = BeautifulSoup(html_content, 'html.parser')
+        self.lenient = False  # Set when lxml could not parse the page and BeautifulSoup did
+        self.root = self._build_tree(html_content)
         self.url = url
         self.domain = urlparse(url).netloc
         self.logger = logger or ScraperLogger()
         self.extraction_stats = {
             'tables': 0, 'lists': 0, 'definitions': 0, 'sections': 0, 'versions': 0
         }
+        # Per-page metadata, computed once and stamped on records as they are built
+        # 64-bit digest of the URL: stable across runs (unlike hash()) and practically collision-free
+        self._url_hash = hashlib.blake2b(url.encode('utf-8'), digest_size=8).hexdigest()
+        self._ts = datetime.now().isoformat()
+        self._record_counter = count(1)
+        # Cleaned text per element; nodes are read by several builders (sections, lists, versions)
+        self._text_cache = {}
+
+    def _build_tree(self, html_content: str):
+        """
+        Parse HTML with lxml, falling back to BeautifulSoup for malformed pages.
+        Comments, scripts, styles and other non-content subtrees are pruned so
+        the extractors never walk them.
+        """
+        try:
+            # lxml rejects str input with an XML encoding declaration (common in XHTML),
+            # so hand it UTF-8 bytes and override whatever encoding the page declares
+            parser = lxml.html.HTMLParser(remove_comments=True, remove_pis=True, encoding='utf-8')
+            root = lxml.html.document_fromstring(html_content.encode('utf-8'), parser=parser)
+        except (etree.ParserError, ValueError):
+            self.lenient = True
+            root = soupparser.fromstring(
+                html_content, beautifulsoup=BeautifulSoup,
+                features=SCRAPING_CONFIG.get('html_parser', 'lxml'),
+                parse_only=SoupStrainer(CONTENT_TAGS),
+            )
+        etree.strip_elements(root, *_NON_CONTENT_TAGS, with_tail=False)
+        return root
+
+    def needs_browser(self) -> bool:
+        """
+        Heuristic: the static HTML has no visible body text, so it is rendered by
+        JavaScript. Reads the already-pruned tree; pages that needed the lenient
+        fallback parser are never sent to the browser.
+        """
+        if self.lenient:
+            return False
+        body = self.root.find('body')
+        if body is None:
+            return True
+        return len(self._node_text(body).strip()) < SCRAPING_CONFIG['min_content_length']
+
+    @staticmethod
+    def _node_text(elem) -> str:
+        """Concatenated text of an element and its descendants (like get_text())."""
+        return ''.join(elem.itertext())
+
+    def _cleaned_text(self, elem) -> str:
+        """Cleaned text of an element, computed once per node."""
+        text = self._text_cache.get(elem)
+        if text is None:
+            text = self._text_cache[elem] = self._clean_text(self._node_text(elem))
+        return text
+
+    def _common_fields(self) -> Dict[str, str]:
+        """Shared fields for a new record, including the next sequential record id."""
+        return {
+            'record_id': f"{self._url_hash}_{next(self._record_counter):06d}",
+            'extraction_timestamp': self._ts,
+            'source_url': self.url,
+            'domain': self.domain,
+        }
 
     def _clean_text(self, text: str) -> str:
         """Enhanced text cleaning for better readability."""
         if not text:
             return ""
-        cleaned = re.sub(r'\s+', ' ', text.strip())
-        cleaned = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', cleaned)
+        cleaned = _WS_RE.sub(' ', text.strip())
+        cleaned = _CTRL_RE.sub('', cleaned)
         # Remove common unwanted patterns
-        cleaned = re.sub(r'\[\d+\]', '', cleaned)  # Remove citation markers [1], [2], etc.
-        cleaned = re.sub(r'\s*\.\s*', '. ', cleaned)  # Fix spacing around periods
+        cleaned = _CITE_RE.sub('', cleaned)  # Remove citation markers [1], [2], etc.
+        cleaned = _DOT_RE.sub('. ', cleaned)  # Fix spacing around periods
         return cleaned.strip()
 
-    def _is_valid_content(self, text: str, min_length: int = None) -> bool:
-        """Check if content meets minimum quality standards."""
-        if min_length is None:
-            min_length = SCRAPING_CONFIG['min_content_length']
+    def _iter_table_records(self, table, table_idx: int) -> Iterator[TableRecord]:
+        """Yield well-structured records, with clear columns, for one table's data rows."""
+        # Get table context
+        caption = table.find('caption')
+        table_context = self._cleaned_text(caption) if caption is not None else f"Table_{table_idx + 1}"
         
-        if not text or len(text) < min_length:
-            return False
+        # Collect rows once; header detection and column count reuse them
+        all_rows = _TABLE_ROWS_XP(table)
+        first_row = all_rows[0] if all_rows else None
+        headers_from_first_row = False
         
-        # Check if text contains meaningful content (not just symbols or numbers)
-        word_count = len(re.findall(r'\b[a-zA-Z]{2,}\b', text))
-        return word_count >= 1
-
-    def _extract_structured_tables(self) -> List[Dict[str, Any]]:
-        """Extract well-structured table data with clear columns."""
-        table_data = []
-        tables = self.soup.find_all('table')
+        # Extract headers
+        headers = [self._cleaned_text(cell) for cell in _HEAD_CELLS_XP(table)]
         
-        for table_idx, table in enumerate(tables):
-            try:
-                # Get table context
-                caption = table.find('caption')
-                table_context = self._clean_text(caption.get_text()) if caption else f"Table_{table_idx + 1}"
-                
-                # Extract headers
-                headers = []
-                header_row = table.find('thead')
-                if header_row:
-                    headers = [self._clean_text(th.get_text()) for th in header_row.find_all(['th', 'td'])]
-                
-                if not headers:
-                    first_row = table.find('tr')
-                    if first_row:
-                        headers = [self._clean_text(cell.get_text()) for cell in first_row.find_all(['th', 'td'])]
-                
-                # Use meaningful default headers
-                if not headers:
-                    max_cols = max(len(row.find_all(['td', 'th'])) for row in table.find_all('tr')) if table.find_all('tr') else 0
-                    headers = [f'Column_{i+1}' for i in range(max_cols)]
-                
-                # Extract data rows
-                rows = table.find('tbody') or table
-                data_rows = rows.find_all('tr')
-                
-                for row_idx, row in enumerate(data_rows):
-                    # Skip if this is likely a header row
-                    if row == first_row:
-                        continue
-                    
-                    cells = row.find_all(['td', 'th'])
-                    if not cells:
-                        continue
-                    
-                    # Create structured record
-                    record = {
-                        'data_type': 'table_data',
-                        'source_url': self.url,
-                        'table_context': table_context,
-                        'row_index': row_idx,
-                        'domain': self.domain,
-                    }
-                    
-                    # Add cell data with meaningful column names
-                    for i, cell in enumerate(cells):
-                        if i < len(headers):
-                            col_name = headers[i] or f'column_{i+1}'
-                        else:
-                            col_name = f'column_{i+1}'
-                        
-                        cell_text = self._clean_text(cell.get_text())
-                        if self._is_valid_content(cell_text):
-                            record[col_name] = cell_text
-                    
-                    # Only add records with meaningful data
-                    data_fields = {k: v for k, v in record.items() if k not in ['data_type', 'source_url', 'table_context', 'row_index', 'domain']}
-                    if any(data_fields.values()):
-                        table_data.append(record)
-                        
-            except Exception as e:
-                self.logger.warning(f"Error parsing table {table_idx}: {e}")
-                continue
+        if not headers and first_row is not None:
+            headers = [self._cleaned_text(cell) for cell in first_row.iterchildren('th', 'td')]
+            headers_from_first_row = True
         
-        self.extraction_stats['tables'] = len(table_data)
-        self.logger.info(f"Extracted {len(table_data)} structured table records")
-        return table_data
-
-    def _extract_version_information(self) -> List[Dict[str, Any]]:
-        """Specifically look for version numbers and release information."""
-        version_data = []
+        # Use meaningful default headers
+        if not headers:
+            max_cols = max((len(list(row.iterchildren('td', 'th'))) for row in all_rows), default=0)
+            headers = [f'Column_{i+1}' for i in range(max_cols)]
         
-        # Common version patterns
-        version_patterns = [
-            r'\b\d+\.\d+\.\d+\b',  # 1.2.3
-            r'\b\d+\.\d+\b',        # 1.2
-            r'\bv?\d+\.\d+\.\d+[a-zA-Z]?\b',  # v1.2.3 or 1.2.3a
-            r'\b\d{4}-\d{2}-\d{2}\b',  # 2024-01-01
-            r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\b',
-        ]
+        # Extract data rows
+        min_length = SCRAPING_CONFIG['min_content_length']
+        data_rows = all_rows if table.find('tbody') is None else _BODY_ROWS_XP(table)
         
-        # Look for version information in various elements
-        elements_to_check = [
-            ('table', self.soup.find_all('table')),
-            ('list', self.soup.find_all(['ul', 'ol'])),
-            ('heading', self.soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])),
-            ('paragraph', self.soup.find_all('p')),
-        ]
+        for row_idx, row in enumerate(data_rows):
+            # Skip the row the headers were taken from (identity check, not a tree compare)
+            if headers_from_first_row and row is first_row:
+                continue
+            
+            # Collect cell data with meaningful column names
+            cells = []
+            for i, cell in enumerate(row.iterchildren('td', 'th')):
+                if i < len(headers):
+                    col_name = headers[i] or f'column_{i+1}'
+                else:
+                    col_name = f'column_{i+1}'
+                
+                cell_text = self._cleaned_text(cell)
+                if len(cell_text) >= min_length and _WORD_RE.search(cell_text):
+                    cells.append((col_name, cell_text))
+            
+            # Only add records with meaningful data
+            if cells:
+                yield TableRecord(
+                    **self._common_fields(),
+                    table_context=table_context,
+                    row_index=row_idx,
+                    cells=tuple(cells),
+                )
+
+    def _iter_list_records(self, list_elem, context: str) -> Iterator[ListRecord]:
+        """Yield structured records for one list's items."""
+        min_length = SCRAPING_CONFIG['min_content_length']
+        items = list(list_elem.iterchildren('li'))
+        for item_idx, item in enumerate(items):
+            text = self._cleaned_text(item)
+            if len(text) >= min_length and _WORD_RE.search(text):
+                yield ListRecord(
+                    **self._common_fields(),
+                    list_context=context,
+                    item_index=item_idx,
+                    content=text,
+                    list_type=list_elem.tag,
+                    total_items=len(items),
+                )
+
+    def _iter_sibling_texts(self, heading):
+        """Yield cleaned text of the nodes following a heading, up to the next heading."""
+        yield self._clean_text(heading.tail)
+        for sibling in heading.itersiblings():
+            if sibling.tag in HEADING_TAGS:
+                return
+            if isinstance(sibling.tag, str):
+                yield self._cleaned_text(sibling)
+            yield self._clean_text(sibling.tail)
+
+    def _section_record(self, heading, heading_text: str) -> Optional[SectionRecord]:
+        """Build a record for the content under a heading, or None if it has none."""
+        content_parts = []
+        content_limit = 5  # Limit number of elements to collect
         
-        for elem_type, elements in elements_to_check:
-            for elem_idx, elem in enumerate(elements):
-                try:
-                    text = self._clean_text(elem.get_text())
-                    if not self._is_valid_content(text, min_length=20):
-                        continue
-                    
-                    # Look for version patterns
-                    for pattern in version_patterns:
-                        versions = re.findall(pattern, text)
-                        if versions:
-                            # Get context
-                            context = "Unknown"
-                            if elem_type == 'table':
-                                context = f"Table_{elem_idx + 1}"
-                            elif elem_type == 'list':
-                                context = f"List_{elem_idx + 1}"
-                            elif elem_type == 'heading':
-                                context = f"Heading: {text[:50]}..."
-                            else:
-                                context = f"Paragraph_{elem_idx + 1}"
-                            
-                            for version in versions[:3]:  # Limit to first 3 versions per element
-                                version_data.append({
-                                    'data_type': 'version_info',
-                                    'source_url': self.url,
-                                    'domain': self.domain,
-                                    'version_number': version,
-                                    'context': context,
-                                    'element_type': elem_type,
-                                    'full_text': text[:200] + '...' if len(text) > 200 else text,
-                                })
-                            
-                except Exception as e:
-                    continue
+        for text in self._iter_sibling_texts(heading):
+            if content_limit <= 0:
+                break
+            if _is_valid_content(text, 30):
+                content_parts.append(text)
+                content_limit -= 1
         
-        self.extraction_stats['versions'] = len(version_data)
-        self.logger.info(f"Found {len(version_data)} version references")
-        return version_data
-
-    def _extract_structured_lists(self) -> List[Dict[str, Any]]:
-        """Extract list data in structured format."""
-        list_data = []
-        lists = self.soup.find_all(['ol', 'ul'])
+        if not content_parts:
+            return None
+        return SectionRecord(
+            **self._common_fields(),
+            heading=heading_text,
+            heading_level=heading.tag,
+            content=' | '.join(content_parts[:3]),  # Combine first 3 content pieces
+            content_pieces=len(content_parts),
+        )
+
+    def _iter_version_records(self, text: str, elem_type: str, elem_idx: int) -> Iterator[VersionRecord]:
+        """Specifically look for version numbers and release information in an element's text."""
+        if not _is_valid_content(text, 20) or not _DIGIT_RE.search(text):
+            return
         
-        for list_idx, list_elem in enumerate(lists):
-            try:
-                # Get list context
-                context = "List"
-                prev_elem = list_elem.find_previous(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'strong', 'b'])
-                if prev_elem:
-                    context = self._clean_text(prev_elem.get_text())[:100]
-                
-                items = list_elem.find_all('li')
-                for item_idx, item in enumerate(items):
-                    text = self._clean_text(item.get_text())
-                    if self._is_valid_content(text):
-                        list_data.append({
-                            'data_type': 'list_item',
-                            'source_url': self.url,
-                            'domain': self.domain,
-                            'list_context': context,
-                            'item_index': item_idx,
-                            'content': text,
-                            'list_type': list_elem.name,
-                            'total_items': len(items),
-                        })
-                        
-            except Exception as e:
-                self.logger.warning(f"Error parsing list {list_idx}: {e}")
-                continue
+        # Get context
+        context = "Unknown"
+        if elem_type == 'table':
+            context = f"Table_{elem_idx + 1}"
+        elif elem_type == 'list':
+            context = f"List_{elem_idx + 1}"
+        elif elem_type == 'heading':
+            context = f"Heading: {text[:50]}..."
+        else:
+            context = f"Paragraph_{elem_idx + 1}"
         
-        self.extraction_stats['lists'] = len(list_data)
-        self.logger.info(f"Extracted {len(list_data)} list items")
-        return list_data
-
-    def _extract_content_sections(self) -> List[Dict[str, Any]]:
-        """Extract structured content from page sections."""
-        section_data = []
-        headings = self.soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+        # Single scan for all version patterns, first 3 matches per element
+        for match in islice(_VERSION_RE.finditer(text), 3):
+            yield VersionRecord(
+                **self._common_fields(),
+                version_number=match.group(),
+                version_kind=match.lastgroup,
+                context=context,
+                element_type=elem_type,
+                full_text=text[:200] + '...' if len(text) > 200 else text,
+            )
+
+    def _iter_records(self) -> Iterator[ScrapedRecord]:
+        """
+        Walk the document once in order, yielding records from each element's
+        builders. The latest heading/<strong>/<b> seen is the context for lists.
+        """
+        stats = self.extraction_stats
+        elem_counts = dict.fromkeys(VERSION_ELEMENT_TYPES.values(), 0)
+        context_elem = None
+        context_text = None
+        min_length = SCRAPING_CONFIG['min_content_length']
         
-        for heading in headings:
-            try:
-                heading_text = self._clean_text(heading.get_text())
-                if not heading_text:
+        for elem in self.root.iter(*_WALK_TAGS):
+            tag = elem.tag
+            if tag in _CONTEXT_TAGS:
+                context_elem, context_text = elem, None
+                if tag not in HEADING_TAGS:
                     continue
+            
+            elem_type = VERSION_ELEMENT_TYPES[tag]
+            elem_idx = elem_counts[elem_type]
+            elem_counts[elem_type] += 1
+            
+            # No cell, item or version can be valid when the whole element is shorter than
+            # the minimum; headings only need some text to title a section
+            text = self._cleaned_text(elem)
+            if not text or (elem_type != 'heading' and len(text) < min_length):
+                continue
+            
+            try:
+                if elem_type == 'table' and SCRAPING_CONFIG['extract_tables']:
+                    for record in self._iter_table_records(elem, elem_idx):
+                        stats['tables'] += 1
+                        yield record
                 
-                # Extract content under this heading
-                content_parts = []
-                next_elem = heading.next_sibling
-                content_limit = 5  # Limit number of elements to collect
+                elif elem_type == 'list' and SCRAPING_CONFIG['extract_lists']:
+                    if context_text is None:
+                        context_text = "List" if context_elem is None else self._cleaned_text(context_elem)[:100]
+                    for record in self._iter_list_records(elem, context_text):
+                        stats['lists'] += 1
+                        yield record
                 
-                while next_elem and content_limit > 0:
-                    if hasattr(next_elem, 'get_text'):
-                        text = self._clean_text(next_elem.get_text())
-                        if self._is_valid_content(text, min_length=30):
-                            content_parts.append(text)
-                            content_limit -= 1
-                    
-                    next_elem = next_elem.next_sibling
-                    if next_elem and next_elem.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                        break
+                elif elem_type == 'heading' and SCRAPING_CONFIG['extract_sections']:
+                    record = self._section_record(elem, text)
+                    if record is not None:
+                        stats['sections'] += 1
+                        yield record
                 
-                if content_parts:
-                    section_data.append({
-                        'data_type': 'section_content',
-                        'source_url': self.url,
-                        'domain': self.domain,
-                        'heading': heading_text,
-                        'heading_level': heading.name,
-                        'content': ' | '.join(content_parts[:3]),  # Combine first 3 content pieces
-                        'content_pieces': len(content_parts),
-                    })
-                    
+                # Always look for version information
+                for record in self._iter_version_records(text, elem_type, elem_idx):
+                    stats['versions'] += 1
+                    yield record
+            
             except Exception as e:
-                self.logger.warning(f"Error extracting section: {e}")
+                self.logger.warning("Error parsing %s %d: %s", elem_type, elem_idx, e)
                 continue
         
-        self.extraction_stats['sections'] = len(section_data)
-        self.logger.info(f"Extracted {len(section_data)} content sections")
-        return section_data
+        self.logger.info(
+            "Extracted %d table records, %d list items, %d content sections, %d version references",
+            stats['tables'], stats['lists'], stats['sections'], stats['versions'],
+        )
 
-    def parse_structured_data(self) -> List[Dict[str, Any]]:
-        """Main method that returns well-structured, organized data."""
-        all_data = []
-        
+    def parse_structured_data(self) -> Iterator[ScrapedRecord]:
+        """Main method that yields well-structured records in document order."""
         self.logger.info("Starting structured data extraction...")
         
-        # Extract different types of data
-        if SCRAPING_CONFIG['extract_tables']:
-            table_data = self._extract_structured_tables()
-            all_data.extend(table_data)
-        
-        if SCRAPING_CONFIG['extract_lists']:
-            list_data = self._extract_structured_lists()
-            all_data.extend(list_data)
+        total = 0
+        for total, record in enumerate(self._iter_records(), 1):
+            yield record
         
-        if SCRAPING_CONFIG['extract_sections']:
-            section_data = self._extract_content_sections()
-            all_data.extend(section_data)
-        
-        # Always look for version information
-        version_data = self._extract_version_information()
-        all_data.extend(version_data)
-        
-        # Add metadata and timestamp
-        timestamp = datetime.now().isoformat()
-        for record in all_data:
-            record['extraction_timestamp'] = timestamp
-            record['record_id'] = f"{hash(self.url) % 10000:04d}_{len(all_data)}"
-        
-        self.logger.success(f"Structured extraction completed: {len(all_data)} meaningful records")
-        return all_data
+        self.logger.success("Structured extraction completed: %d meaningful records", total)
 
     def get_extraction_report(self) -> Dict[str, Any]:
         """Get extraction statistics report."""
@@ -425,151 +616,324 @@ class StructuredDataParser:
 # 4. ENHANCED CSV EXPORTER WITH BETTER FORMATTING
 # ==============================================================================
 
+# Define column order for better readability
+_BASE_COLUMNS = ('record_id', 'data_type', 'source_url', 'domain', 'extraction_timestamp')
+_TYPE_SPECIFIC_COLUMNS = {
+    'table_data': ('table_context', 'row_index', 'column_1', 'column_2', 'column_3', 'column_4', 'additional_data'),
+    'version_info': ('version_number', 'version_kind', 'context', 'element_type', 'full_text'),
+    'list_item': ('list_context', 'item_index', 'content', 'list_type', 'total_items'),
+    'section_content': ('heading', 'heading_level', 'content', 'content_pieces'),
+}
+EXPORT_COLUMNS = tuple(sorted({*_BASE_COLUMNS, *(col for cols in _TYPE_SPECIFIC_COLUMNS.values() for col in cols)}))
+
+# Rows buffered between the producer and a CSV writer thread; bounds memory on large crawls
+WRITE_QUEUE_SIZE = 1024
+
+_QUEUE_DONE = object()  # Sentinel telling a writer thread to finish
+
+def open_csv_output(filename: str, buffer_size: int, compress: bool = False) -> TextIO:
+    """
+    Open an output CSV for text writing. With compress, the text is gzip-compressed
+    at level 1 (cheap next to building the rows) in buffer-sized blocks.
+    """
+    if not compress:
+        return open(filename, 'w', newline='', encoding='utf-8', buffering=buffer_size)
+    gz = gzip.GzipFile(filename, mode='wb', compresslevel=1)
+    return io.TextIOWrapper(io.BufferedWriter(gz, buffer_size), encoding='utf-8', newline='')
+
+class CSVStreamWriter:
+    """
+    Writes CSV rows from a dedicated thread fed through a bounded queue, so the
+    file is written while later records are still being produced. The file is
+    only created once the first row arrives.
+    """
+    
+    def __init__(self, filename: str, columns: Sequence[str], logger: ScraperLogger = None,
+                 queue_size: int = WRITE_QUEUE_SIZE, buffer_size: int = None, compress: bool = False):
+        if not filename.endswith('.csv'):
+            filename += '.csv'
+        if compress:
+            filename += '.gz'
+        self.filename = filename
+        self.columns = columns
+        self.logger = logger or ScraperLogger()
+        self.buffer_size = buffer_size or SCRAPING_CONFIG['write_buffer_bytes']
+        self.compress = compress
+        self.rows_written = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name=f"csv-writer-{filename}", daemon=True)
+    
+    def __enter__(self) -> 'CSVStreamWriter':
+        self._thread.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._queue.put(_QUEUE_DONE)
+        self._thread.join()
+        if exc_type is None and self._error is not None:
+            raise ExportException(f"Error exporting CSV {self.filename}: {self._error}")
+        if exc_type is None and self.rows_written:
+            self.logger.success("Formatted CSV exported: %s", self.filename)
+            self.logger.info("Total records: %d", self.rows_written)
+            self.logger.info("Columns: %d", len(self.columns))
+        return False
+    
+    def write_rows(self, rows: Iterable[Sequence[Any]]):
+        """Queue rows for the writer thread, blocking while the queue is full."""
+        for row in rows:
+            if self._error is not None:
+                raise ExportException(f"Error exporting CSV {self.filename}: {self._error}")
+            self._queue.put(row)
+    
+    def _run(self):
+        """Writer thread: write queued rows until the sentinel arrives."""
+        csvfile = None
+        try:
+            for row in iter(self._queue.get, _QUEUE_DONE):
+                if csvfile is None:
+                    csvfile = open_csv_output(self.filename, self.buffer_size, self.compress)
+                    writer = csv.writer(csvfile)
+                    writer.writerow(self.columns)
+                writer.writerow(row)
+                self.rows_written += 1
+        except Exception as e:
+            self._error = e
+            # Keep draining so the producer never blocks on a full queue
+            for _ in iter(self._queue.get, _QUEUE_DONE):
+                pass
+        finally:
+            if csvfile is not None:
+                try:
+                    csvfile.close()
+                except OSError as e:
+                    self._error = self._error or e
+
 class FormattedCSVExporter:
     """
-    Creates well-formatted, readable CSV files with proper organization.
+    Lays records out as well-formatted, readable CSV rows with proper organization;
+    CSVExportSession writes them to the output files.
     """
     
-    def __init__(self, data: List[Dict[str, Any]], logger: ScraperLogger = None):
+    def __init__(self, data: Iterable[ScrapedRecord], logger: ScraperLogger = None):
         self.original_data = data
         self.logger = logger or ScraperLogger()
-        self.data = self._organize_data(data)
     
-    def _organize_data(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Organize data by type and ensure consistent structure."""
-        organized_data = []
-        
+    def _iter_organized(self, data: Iterable[ScrapedRecord]) -> Iterator[Dict[str, Any]]:
+        """Yield records as flat dicts with a consistent structure, one at a time."""
         for record in data:
             # Create a standardized record format
             standardized = {
-                'record_id': record.get('record_id', ''),
-                'data_type': record.get('data_type', 'unknown'),
-                'source_url': record.get('source_url', ''),
-                'domain': record.get('domain', ''),
-                'extraction_timestamp': record.get('extraction_timestamp', ''),
+                'record_id': record.record_id,
+                'data_type': record.data_type,
+                'source_url': record.source_url,
+                'domain': record.domain,
+                'extraction_timestamp': record.extraction_timestamp,
             }
             
             # Add type-specific fields in a consistent way
-            data_type = record.get('data_type', '')
+            record_type = type(record)
             
-            if data_type == 'table_data':
+            if record_type is TableRecord:
+                cells = dict(record.cells)
                 standardized.update({
-                    'table_context': record.get('table_context', ''),
-                    'row_index': record.get('row_index', ''),
-                    'column_1': record.get(record.get('column_1', 'column_1'), ''),
-                    'column_2': record.get(record.get('column_2', 'column_2'), ''),
-                    'column_3': record.get(record.get('column_3', 'column_3'), ''),
-                    'column_4': record.get(record.get('column_4', 'column_4'), ''),
-                    'additional_data': str({k: v for k, v in record.items() 
-                                          if k not in standardized and k not in ['table_context', 'row_index']})
+                    'table_context': record.table_context,
+                    'row_index': record.row_index,
+                    'column_1': cells.get('column_1', ''),
+                    'column_2': cells.get('column_2', ''),
+                    'column_3': cells.get('column_3', ''),
+                    'column_4': cells.get('column_4', ''),
+                    'additional_data': json.dumps(cells, ensure_ascii=False, separators=(',', ':')),
                 })
             
-            elif data_type == 'version_info':
+            elif record_type is VersionRecord:
                 standardized.update({
-                    'version_number': record.get('version_number', ''),
-                    'context': record.get('context', ''),
-                    'element_type': record.get('element_type', ''),
-                    'full_text': record.get('full_text', '')[:100],  # Truncate long text
+                    'version_number': record.version_number,
+                    'version_kind': record.version_kind,
+                    'context': record.context,
+                    'element_type': record.element_type,
+                    'full_text': record.full_text[:100],  # Truncate long text
                 })
             
-            elif data_type == 'list_item':
+            elif record_type is ListRecord:
                 standardized.update({
-                    'list_context': record.get('list_context', ''),
-                    'item_index': record.get('item_index', ''),
-                    'content': record.get('content', ''),
-                    'list_type': record.get('list_type', ''),
-                    'total_items': record.get('total_items', ''),
+                    'list_context': record.list_context,
+                    'item_index': record.item_index,
+                    'content': record.content,
+                    'list_type': record.list_type,
+                    'total_items': record.total_items,
                 })
             
-            elif data_type == 'section_content':
+            elif record_type is SectionRecord:
                 standardized.update({
-                    'heading': record.get('heading', ''),
-                    'heading_level': record.get('heading_level', ''),
-                    'content': record.get('content', ''),
-                    'content_pieces': record.get('content_pieces', ''),
+                    'heading': record.heading,
+                    'heading_level': record.heading_level,
+                    'content': record.content,
+                    'content_pieces': record.content_pieces,
                 })
             
             else:
                 # For unknown types, include all fields in a structured way
-                content_fields = {k: v for k, v in record.items() 
-                                if k not in standardized and k != 'data_type'}
+                content_fields = {k: v for k, v in asdict(record).items() if k not in standardized}
                 standardized['content'] = str(content_fields) if content_fields else ''
             
-            organized_data.append(standardized)
-        
-        return organized_data
+            yield standardized
     
-    def export_formatted_csv(self, filename: str):
-        """Export data to a well-formatted CSV file."""
-        if not filename.endswith('.csv'):
-            filename += '.csv'
-        
-        if not self.data:
-            self.logger.warning("No data to export")
-            return
-        
-        try:
-            # Define column order for better readability
-            base_columns = ['record_id', 'data_type', 'source_url', 'domain', 'extraction_timestamp']
-            type_specific_columns = {
-                'table_data': ['table_context', 'row_index', 'column_1', 'column_2', 'column_3', 'column_4', 'additional_data'],
-                'version_info': ['version_number', 'context', 'element_type', 'full_text'],
-                'list_item': ['list_context', 'item_index', 'content', 'list_type', 'total_items'],
-                'section_content': ['heading', 'heading_level', 'content', 'content_pieces'],
-            }
-            
-            # Get all possible columns
-            all_columns = set(base_columns)
-            for columns in type_specific_columns.values():
-                all_columns.update(columns)
-            
-            # Write to CSV
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=sorted(all_columns))
-                writer.writeheader()
-                
-                for record in self.data:
-                    # Ensure all columns are present in each record
-                    full_record = {col: record.get(col, '') for col in sorted(all_columns)}
-                    writer.writerow(full_record)
-            
-            self.logger.success(f"Formatted CSV exported: {filename}")
-            self.logger.info(f"Total records: {len(self.data)}")
-            self.logger.info(f"Columns: {len(all_columns)}")
-            
-        except Exception as e:
-            raise ExportException(f"Error exporting CSV: {e}")
+    def _iter_rows(self, records: Iterable[ScrapedRecord]) -> Iterator[List[Any]]:
+        """Yield organized records as CSV rows in EXPORT_COLUMNS order."""
+        for record in self._iter_organized(records):
+            yield [record.get(col, '') for col in EXPORT_COLUMNS]
+    
+    def iter_rows(self) -> Iterator[List[Any]]:
+        """Yield this exporter's records as CSV rows in EXPORT_COLUMNS order."""
+        return self._iter_rows(self.original_data)
+
+class CSVExportSession:
+    """
+    The main and per-data-type CSV files of one run, kept open so each page's
+    records are written as soon as they are parsed and need not be kept.
+    """
     
-    def export_by_data_type(self, base_filename: str):
-        """Export separate CSV files for each data type."""
-        data_by_type = {}
+    def __init__(self, output_base: str, logger: ScraperLogger = None, buffer_size: int = None,
+                 compress: bool = False):
+        self.output_base = output_base
+        self.logger = logger or ScraperLogger()
+        self.buffer_size = buffer_size
+        self.compress = compress
+        self.type_counts = Counter()
+        self._outputs = ExitStack()
+        self._main_csv = None
+        self._type_csvs = {}
+    
+    def __enter__(self) -> 'CSVExportSession':
+        self._main_csv = self._outputs.enter_context(
+            CSVStreamWriter(self.output_base, EXPORT_COLUMNS, self.logger, buffer_size=self.buffer_size,
+                            compress=self.compress)
+        )
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self._outputs.__exit__(exc_type, exc_value, traceback)
+    
+    def write(self, records: List[ScrapedRecord]):
+        """Write one page's records to the main CSV and to their data type's CSV."""
+        rows = list(FormattedCSVExporter(records, self.logger).iter_rows())
+        self._main_csv.write_rows(rows)
         
-        for record in self.data:
-            data_type = record.get('data_type', 'unknown')
-            if data_type not in data_by_type:
-                data_by_type[data_type] = []
-            data_by_type[data_type].append(record)
+        # Each record is organized once; its row goes to both files
+        rows_by_type = defaultdict(list)
+        for record, row in zip(records, rows):
+            rows_by_type[record.data_type].append(row)
         
-        for data_type, records in data_by_type.items():
-            # Clean filename
-            clean_type = data_type.replace(' ', '_').lower()
-            filename = f"{base_filename}_{clean_type}.csv"
-            
-            if records:
-                exporter = FormattedCSVExporter(records, self.logger)
-                exporter.export_formatted_csv(filename)
-                self.logger.info(f"Exported {len(records)} {data_type} records to {filename}")
+        for data_type, type_rows in rows_by_type.items():
+            stream = self._type_csvs.get(data_type)
+            if stream is None:
+                # Clean filename
+                clean_type = data_type.replace(' ', '_').lower()
+                stream = self._outputs.enter_context(
+                    CSVStreamWriter(f"{self.output_base}_{clean_type}.csv", EXPORT_COLUMNS, self.logger,
+                                    buffer_size=self.buffer_size, compress=self.compress)
+                )
+                self._type_csvs[data_type] = stream
+            stream.write_rows(type_rows)
+            self.type_counts[data_type] += len(type_rows)
 
 # ==============================================================================
 # 5. ENHANCED MAIN SCRAPER WITH BETTER OUTPUT
 # ==============================================================================
 
+# Columns of the summary report; each row type fills only its own subset
+SUMMARY_FIELDS = (
+    'report_type', 'total_urls', 'successful_urls', 'failed_urls',
+    'total_records', 'success_rate', 'scraping_duration', 'url',
+    'records_extracted', 'status', 'domain', 'data_type', 'record_count', 'percentage',
+)
+
+def _summary_row_format(*fields: str) -> Callable[..., List[Any]]:
+    """
+    Build the row function for one report type. It places that type's values, given
+    in `fields` order, into a full-width SUMMARY_FIELDS row; column positions are
+    resolved once here rather than looked up by name on every row.
+    """
+    slots = tuple(SUMMARY_FIELDS.index(field) for field in fields)
+    blank = [''] * len(SUMMARY_FIELDS)
+    
+    def format_row(*values) -> List[Any]:
+        row = blank.copy()
+        for slot, value in zip(slots, values):
+            row[slot] = value
+        return row
+    
+    return format_row
+
+_OVERALL_ROW = _summary_row_format(
+    'report_type', 'total_urls', 'successful_urls', 'failed_urls',
+    'total_records', 'success_rate', 'scraping_duration',
+)
+_URL_ROW = _summary_row_format('report_type', 'url', 'records_extracted', 'status', 'domain')
+_TYPE_ROW = _summary_row_format('report_type', 'data_type', 'record_count', 'percentage')
+
+_DEFAULT_PORTS = {'http': ':80', 'https': ':443'}
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of a URL for de-duplication: lowercase scheme and host, no default
+    port, '/' for an empty path and no fragment (it is never sent to the server).
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    userinfo, at, hostport = parts.netloc.rpartition('@')
+    hostport = hostport.lower()
+    default_port = _DEFAULT_PORTS.get(scheme)
+    if default_port and hostport.endswith(default_port):
+        hostport = hostport[:-len(default_port)]
+    return urlunsplit((scheme, userinfo + at + hostport, parts.path or '/', parts.query, ''))
+
+def _parse_page(url: str, html_content: str, logger: ScraperLogger = None,
+                render_check: bool = True) -> Optional[List[ScrapedRecord]]:
+    """
+    Parse one fetched page. Module-level so it can run in a worker process.
+    Returns None, with render_check, when the page has no body text and must be
+    rendered in a browser first; the check reuses the tree built for parsing.
+    """
+    parser = StructuredDataParser(html_content, url, logger)
+    if render_check and parser.needs_browser():
+        return None
+    return list(parser.parse_structured_data())
+
 class FormattedScraper:
     """Main scraper that produces well-formatted, organized output."""
     
     def __init__(self, config: ScraperConfig = None):
         self.config = config or ScraperConfig()
         self.logger = ScraperLogger("FormattedScraper")
+        self._reset_stats()
+        # Request limits for async mode, created per run inside its event loop
+        self._global_semaphore = None
+        self._host_semaphores = None
+        # Connection-pooled client shared by sync fetches; created on first use, see close()
+        self.http = None
+        # Worker processes for parsing, kept across runs; created on first use, see close()
+        self.pool = None
+
+    def __enter__(self) -> 'FormattedScraper':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def close(self):
+        """Close the shared HTTP client and shut down the parser worker processes."""
+        if self.http is not None:
+            self.http.close()
+            self.http = None
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def _reset_stats(self):
+        """Start fresh stats and run clock; a scraper (and its pool) may serve several runs."""
         self.stats = {
             'start_time': datetime.now(),
             'urls_processed': 0,
@@ -577,131 +941,363 @@ class FormattedScraper:
             'urls_failed': 0,
             'total_records': 0,
         }
+        # Durations come from the monotonic clock, which wall-clock adjustments cannot skew
+        self._started = time.monotonic()
+
+    def _http_client(self) -> httpx.Client:
+        """Return the shared client for sync fetches, so keep-alive connections are reused."""
+        if self.http is None:
+            if self._use_http_cache():
+                storage = SyncSqliteStorage(database_path=self.config.http_cache_path)
+                self.http = SyncCacheClient(storage=storage, **self._client_options())
+            else:
+                self.http = httpx.Client(**self._client_options())
+        return self.http
+
+    def _client_options(self) -> Dict[str, Any]:
+        """Options for the sync and async clients alike, so both modes fetch the same way."""
+        return {
+            'headers': DEFAULT_HEADERS,
+            'http2': HTTP2_AVAILABLE,
+            'limits': httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            'timeout': self.config.timeout,
+            'follow_redirects': True,
+        }
+
+    def _use_http_cache(self) -> bool:
+        """
+        Whether clients should go through the on-disk response cache, so unchanged
+        pages are revalidated (304 Not Modified) on re-runs instead of re-downloaded.
+        """
+        return HTTP_CACHE_AVAILABLE and bool(self.config.http_cache_path)
+
+    def _parse_pool(self, pages: int) -> Optional[ProcessPoolExecutor]:
+        """
+        Return the worker pool for parsing `pages` pages, or None to parse in this
+        process when a pool would not help (one page, or one worker configured).
+        """
+        if min(self.config.parse_workers, pages) <= 1:
+            return None
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.config.parse_workers)
+        return self.pool
+
+    def _discard_pool(self, pool: ProcessPoolExecutor):
+        """
+        Drop a pool that broke because a worker died (e.g. out of memory), so the
+        next _parse_pool() call starts a fresh one instead of failing every parse.
+        """
+        if self.pool is pool:
+            self.logger.warning("A parse worker died; pages affected are parsed in-process")
+            self.pool = None
+        pool.shutdown(wait=False)
+
+    def _pool_result(self, pool: ProcessPoolExecutor, future: Future, url: str,
+                     content: str) -> Optional[List[ScrapedRecord]]:
+        """A page's parse result from the pool, parsing it here if the pool broke meanwhile."""
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            self._discard_pool(pool)
+            return _parse_page(url, content, self.logger)
+
+    def _record_success(self, url: str, data: List[ScrapedRecord]):
+        """Update stats for a successfully scraped URL."""
+        self.stats['urls_processed'] += 1
+        self.stats['urls_successful'] += 1
+        self.stats['total_records'] += len(data)
+        self.logger.success("Extracted %d meaningful records from %s", len(data), url)
+
+    def _record_failure(self, url: str, error: Exception):
+        """Update stats for a URL that could not be fetched or parsed."""
+        self.stats['urls_processed'] += 1
+        self.stats['urls_failed'] += 1
+        self.logger.failure("Failed to scrape %s: %s", url, error)
+
+    def _parse_rendered(self, url: str, content: str) -> List[ScrapedRecord]:
+        """Render a page whose static HTML has no text in a browser, then parse the result."""
+        return _parse_page(url, self._render(url, content), self.logger, render_check=False)
 
-    def scrape_url(self, url: str) -> List[Dict[str, Any]]:
+    def _render(self, url: str, content: str) -> str:
+        """Re-fetch a JavaScript-rendered page with a browser, keeping the static HTML on failure."""
+        self.logger.info("%s Static HTML has no content, rendering in browser: %s", EMOJI_BROWSER, url)
+        try:
+            return DynamicScraper(url, self.config, self.logger).scrape()
+        except Exception as e:
+            self.logger.warning("Browser rendering failed for %s, using static HTML: %s", url, e)
+            return content
+
+    def _fetch(self, url: str) -> Optional[str]:
+        """Fetch a URL's HTML, returning None (and recording the failure) on error."""
+        try:
+            self.logger.info("%s Scraping: %s", EMOJI_FETCH, url)
+            content = StaticScraper(url, self.config, self.logger, client=self._http_client()).scrape()
+        except Exception as e:
+            self._record_failure(url, e)
+            return None
+        return content
+
+    async def _fetch_async(self, client: httpx.AsyncClient, url: str) -> Optional[str]:
+        """
+        Fetch a URL's HTML with retries and exponential backoff; None on failure.
+        A global request slot is held only while a request is in flight, so URLs
+        backing off between retries do not starve healthy ones. The per-host slot
+        is deliberately kept through the backoff as well: a host that is failing
+        or rate limiting gets fewer requests, not the next queued one at once.
+        """
+        async with self._host_semaphores[urlparse(url).netloc]:
+            self.logger.info("%s Scraping: %s", EMOJI_FETCH, url)
+            # The first request is always made, even with retries configured off
+            attempts = max(1, self.config.retry_attempts)
+            for attempt in range(1, attempts + 1):
+                try:
+                    async with self._global_semaphore, client.stream('GET', url) as response:
+                        response.raise_for_status()
+                        body = bytearray()
+                        async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                            body += chunk
+                            _check_body_size(url, len(body), self.config.max_content_size)
+                    content = _decode_body(response, body)
+                    break
+                except FetchException as e:
+                    self._record_failure(url, e)
+                    return None
+                except httpx.HTTPError as e:
+                    # Client errors (other than rate limiting) will not succeed on retry
+                    status = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None
+                    retryable = status is None or status == 429 or status >= 500
+                    if not retryable or attempt == attempts:
+                        self._record_failure(url, e)
+                        return None
+                    delay = self.config.retry_delay * 2 ** (attempt - 1)
+                    self.logger.warning("Attempt %d failed for %s, retrying in %ss: %s", attempt, url, delay, e)
+                    await asyncio.sleep(delay)
+        return content
+
+    async def scrape_url_async(self, client: httpx.AsyncClient, url: str,
+                               pool: Optional[ProcessPoolExecutor] = None) -> List[ScrapedRecord]:
+        """
+        Fetch and parse a single URL. Parsing runs in `pool` (or the default thread
+        pool) so it overlaps with the fetches still in flight for other URLs.
+        """
+        content = await self._fetch_async(client, url)
+        if content is None:
+            return []
+        
+        loop = asyncio.get_running_loop()
+        try:
+            if pool is None:
+                data = await loop.run_in_executor(None, _parse_page, url, content, self.logger)
+            else:
+                try:
+                    data = await loop.run_in_executor(pool, _parse_page, url, content)
+                except BrokenProcessPool:
+                    self._discard_pool(pool)
+                    data = await loop.run_in_executor(None, _parse_page, url, content, self.logger)
+            if data is None:
+                # Browser rendering blocks, so it stays off the event loop too
+                data = await loop.run_in_executor(None, self._parse_rendered, url, content)
+        except Exception as e:
+            self._record_failure(url, e)
+            return []
+        
+        self._record_success(url, data)
+        return data
+
+    async def _scrape_all_async(self, urls: List[str], on_page: Callable[[str, List[ScrapedRecord]], None]):
+        """
+        Scrape all URLs concurrently over one shared client, bounded by max_concurrency
+        overall and per_host_limit per host. on_page receives each URL's records in
+        input order as soon as they are ready; it runs in the default executor, since
+        exporting can block on file I/O or a full writer queue and would otherwise
+        stall every fetch in flight.
+        """
+        # asyncio primitives must be created in the loop that uses them (Python < 3.10)
+        self._global_semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        self._host_semaphores = defaultdict(partial(asyncio.Semaphore, self.config.per_host_limit))
+        pool = self._parse_pool(len(urls))
+        if self._use_http_cache():
+            storage = AsyncSqliteStorage(database_path=self.config.http_cache_path)
+            client = AsyncCacheClient(storage=storage, **self._client_options())
+        else:
+            client = httpx.AsyncClient(**self._client_options())
+        loop = asyncio.get_running_loop()
+        async with client:
+            tasks = [
+                asyncio.ensure_future(self.scrape_url_async(client, url, pool))
+                for url in urls
+            ]
+            for url, task in zip(urls, tasks):
+                try:
+                    data = await task
+                except Exception as e:
+                    self._record_failure(url, e)
+                    data = []
+                # Pages are handed over one at a time, so on_page is never run concurrently
+                await loop.run_in_executor(None, on_page, url, data)
+
+    def scrape_url(self, url: str) -> List[ScrapedRecord]:
         """Scrape a single URL and return structured data."""
+        content = self._fetch(url)
+        if content is None:
+            return []
+        
         try:
-            self.logger.info(f"🔄 Scraping: {url}")
-            
-            # Fetch content
-            scraper = StaticScraper(url, self.config, self.logger)
-            content = scraper.scrape()
-            
-            # Parse with structured parser
-            parser = StructuredDataParser(content, url, self.logger)
-            data = parser.parse_structured_data()
-            
-            self.stats['urls_processed'] += 1
-            self.stats['urls_successful'] += 1
-            self.stats['total_records'] += len(data)
-            
-            self.logger.success(f"✅ Extracted {len(data)} meaningful records from {url}")
-            
-            return data
-            
+            data = _parse_page(url, content, self.logger)
+            if data is None:
+                data = self._parse_rendered(url, content)
         except Exception as e:
-            self.stats['urls_processed'] += 1
-            self.stats['urls_failed'] += 1
-            self.logger.failure(f"❌ Failed to scrape {url}: {e}")
+            self._record_failure(url, e)
             return []
+        
+        self._record_success(url, data)
+        return data
+
+    def _iter_parsed_pages(self, pages: List[Tuple[str, Optional[str]]]) -> Iterator[Tuple[str, List[ScrapedRecord]]]:
+        """
+        Parse fetched pages, fanning out to worker processes when there are several.
+        Yields (url, records) in input order as soon as each page is parsed; pages
+        that failed to fetch or parse yield no records.
+        """
+        pool = self._parse_pool(sum(content is not None for _, content in pages))
+        futures = None
+        if pool is not None:
+            try:
+                futures = [
+                    None if content is None else pool.submit(_parse_page, url, content)
+                    for url, content in pages
+                ]
+            except BrokenProcessPool:
+                # A worker died after the previous run; this run parses in-process
+                self._discard_pool(pool)
+        
+        if futures is None:
+            for url, content in pages:
+                data = []
+                if content is not None:
+                    try:
+                        data = _parse_page(url, content, self.logger)
+                        if data is None:
+                            data = self._parse_rendered(url, content)
+                    except Exception as e:
+                        self._record_failure(url, e)
+                    else:
+                        self._record_success(url, data)
+                yield url, data
+            return
+        
+        for (url, content), future in zip(pages, futures):
+            data = []
+            if future is not None:
+                try:
+                    data = self._pool_result(pool, future, url, content)
+                    if data is None:
+                        data = self._parse_rendered(url, content)
+                except Exception as e:
+                    self._record_failure(url, e)
+                else:
+                    self._record_success(url, data)
+            yield url, data
 
     def run_scraping(self, urls: List[str], output_base: str) -> Dict[str, Any]:
         """Run scraping on all URLs and export formatted results."""
-        self.logger.info(f"🚀 Starting formatted scraping for {len(urls)} URLs")
+        self._reset_stats()
+        self.logger.info("%s Starting formatted scraping for %d URLs", EMOJI_START, len(urls))
         
-        all_data = []
-        url_reports = []
+        # Skip repeated URLs (order kept), including ones that differ only in form
+        unique_urls = list(dict.fromkeys(map(normalize_url, urls)))
+        if len(unique_urls) < len(urls):
+            self.logger.info("Deduplicated to %d unique URLs", len(unique_urls))
+        urls = unique_urls
+        if not urls:
+            self.logger.warning("No URLs to scrape, nothing exported")
+            return {'stats': self.stats.copy()}
         
-        for url in urls:
-            data = self.scrape_url(url)
-            all_data.extend(data)
+        # Each page's rows go to the main and per-type CSVs as soon as it is parsed,
+        # in input order; records are not kept once written. Per-URL summary rows
+        # are likewise streamed to a temp file and copied into the summary at the end.
+        reports_filename = f"{output_base}_url_reports.tmp.csv"
+        try:
+            with CSVExportSession(output_base, self.logger, self.config.write_buffer_bytes,
+                                  self.config.compress_output) as export, \
+                    open(reports_filename, 'w', newline='', encoding='utf-8',
+                         buffering=self.config.write_buffer_bytes) as reports_file:
+                reports = csv.writer(reports_file, quoting=csv.QUOTE_MINIMAL)
+                
+                def collect(url: str, data: List[ScrapedRecord]):
+                    export.write(data)
+                    reports.writerow(_URL_ROW(
+                        'URL_REPORT', url, len(data), 'success' if data else 'failed', urlparse(url).netloc
+                    ))
+                
+                if USE_ASYNC_MODE:
+                    # Fetch concurrently; each page is parsed while other fetches are in flight
+                    asyncio.run(self._scrape_all_async(urls, collect))
+                else:
+                    # Fetch every page first, then parse the CPU-bound part in parallel
+                    contents = [self._fetch(url) for url in urls]
+                    for url, data in self._iter_parsed_pages(list(zip(urls, contents))):
+                        collect(url, data)
             
-            url_reports.append({
-                'url': url,
-                'records_extracted': len(data),
-                'status': 'success' if data else 'failed'
-            })
-        
-        # Export formatted results
-        if all_data:
-            self._export_results(all_data, output_base, url_reports)
-        else:
-            self.logger.warning("No data collected from any URL")
+            # Export the summary report
+            if export.type_counts:
+                self._create_summary_report(output_base, reports_filename, len(urls), export.type_counts)
+            else:
+                self.logger.warning("No data collected from any URL")
+        finally:
+            if os.path.exists(reports_filename):
+                os.remove(reports_filename)
         
         return {
-            'data': all_data,
-            'url_reports': url_reports,
             'stats': self.stats.copy()
         }
     
-    def _export_results(self, data: List[Dict[str, Any]], output_base: str, url_reports: List[Dict]):
-        """Export results in multiple formatted ways."""
-        # Main combined CSV
-        main_exporter = FormattedCSVExporter(data, self.logger)
-        main_exporter.export_formatted_csv(output_base)
-        
-        # Separate CSVs by data type
-        main_exporter.export_by_data_type(output_base)
-        
-        # Create a summary report
-        self._create_summary_report(output_base, url_reports, data)
+    def _overall_row(self, total_urls: int) -> List[Any]:
+        """Overall summary row of the summary report."""
+        successful = self.stats['urls_successful']
+        success_rate = successful * 100.0 / total_urls
+        duration = time.monotonic() - self._started
+        return _OVERALL_ROW(
+            'OVERALL_SUMMARY', total_urls, successful, self.stats['urls_failed'],
+            self.stats['total_records'], f"{success_rate:.1f}%", f"{duration:.1f}s",
+        )
     
-    def _create_summary_report(self, output_base: str, url_reports: List[Dict], data: List[Dict]):
-        """Create a summary CSV with scraping statistics."""
-        summary_data = []
-        
-        # Overall summary
-        summary_data.append({
-            'report_type': 'OVERALL_SUMMARY',
-            'total_urls': len(url_reports),
-            'successful_urls': self.stats['urls_successful'],
-            'failed_urls': self.stats['urls_failed'],
-            'total_records': self.stats['total_records'],
-            'success_rate': f"{(self.stats['urls_successful'] / len(url_reports) * 100):.1f}%",
-            'scraping_duration': f"{(datetime.now() - self.stats['start_time']).total_seconds():.1f}s",
-        })
-        
-        # Per-URL summary
-        for report in url_reports:
-            summary_data.append({
-                'report_type': 'URL_REPORT',
-                'url': report['url'],
-                'records_extracted': report['records_extracted'],
-                'status': report['status'],
-                'domain': urlparse(report['url']).netloc,
-            })
-        
-        # Data type summary
-        data_by_type = {}
-        for record in data:
-            data_type = record.get('data_type', 'unknown')
-            data_by_type[data_type] = data_by_type.get(data_type, 0) + 1
-        
-        for data_type, count in data_by_type.items():
-            summary_data.append({
-                'report_type': 'DATA_TYPE_SUMMARY',
-                'data_type': data_type,
-                'record_count': count,
-                'percentage': f"{(count / len(data) * 100):.1f}%",
-            })
+    @staticmethod
+    def _type_rows(type_counts: Counter, total_records: int) -> Iterator[List[Any]]:
+        """Data type summary rows."""
+        inv_records = 100.0 / total_records  # One divide, not one per row
+        for data_type, count in type_counts.items():
+            yield _TYPE_ROW('DATA_TYPE_SUMMARY', data_type, count, f"{count * inv_records:.1f}%")
+    
+    def _create_summary_report(self, output_base: str, reports_filename: str, total_urls: int,
+                               type_counts: Counter):
+        """
+        Create a summary CSV with scraping statistics; rows are written as they are built
+        and the per-URL rows are copied over verbatim from `reports_filename`. Only
+        called by run_scraping for runs that collected records, so the URL and record
+        totals are never zero.
+        """
+        total_records = sum(type_counts.values())
         
         # Export summary
         summary_filename = f"{output_base}_summary.csv"
+        if self.config.compress_output:
+            summary_filename += '.gz'
         try:
-            with open(summary_filename, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['report_type', 'total_urls', 'successful_urls', 'failed_urls', 
-                            'total_records', 'success_rate', 'scraping_duration', 'url',
-                            'records_extracted', 'status', 'domain', 'data_type', 'record_count', 'percentage']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for record in summary_data:
-                    writer.writerow(record)
+            with open_csv_output(summary_filename, self.config.write_buffer_bytes,
+                                 self.config.compress_output) as csvfile:
+                # Rows arrive already laid out in SUMMARY_FIELDS order
+                writer = csv.writer(csvfile, quoting=csv.QUOTE_MINIMAL)
+                writer.writerow(SUMMARY_FIELDS)
+                writer.writerow(self._overall_row(total_urls))
+                with open(reports_filename, newline='', encoding='utf-8') as reports_file:
+                    shutil.copyfileobj(reports_file, csvfile, self.config.write_buffer_bytes)
+                writer.writerows(self._type_rows(type_counts, total_records))
             
-            self.logger.success(f"Summary report exported: {summary_filename}")
+            self.logger.success("Summary report exported: %s", summary_filename)
             
         except Exception as e:
-            self.logger.error(f"Error exporting summary: {e}")
+            self.logger.error("Error exporting summary: %s", e)
 
 # ==============================================================================
 # 6. MAIN EXECUTION FUNCTION
@@ -720,40 +1316,47 @@ def run_formatted_scraper(urls: List[str] = None, output_name: str = None):
     if output_name is None:
         output_name = DEFAULT_OUTPUT_FILENAME
     
-    print("=" * 70)
-    print("📊 FORMATTED WEB SCRAPER - WELL-STRUCTURED CSV OUTPUT")
-    print("=" * 70)
-    print(f"📋 URLs to scrape: {len(urls)}")
-    print(f"💾 Output base: {output_name}")
-    print()
-    
-    # Print URL list
-    print("🌐 Target URLs:")
-    for i, url in enumerate(urls, 1):
-        print(f"   {i:2d}. {url}")
-    print()
+    # Each banner is built once and written in a single call, not one print per line
+    rule = "=" * 70
+    sys.stdout.write("\n".join([
+        rule,
+        "📊 FORMATTED WEB SCRAPER - WELL-STRUCTURED CSV OUTPUT",
+        rule,
+        f"📋 URLs to scrape: {len(urls)}",
+        f"💾 Output base: {output_name}",
+        "",
+        f"{EMOJI_BROWSER} Target URLs:",
+        *[f"   {i:2d}. {url}" for i, url in enumerate(urls, 1)],
+        "",
+    ]) + "\n")
+    sys.stdout.flush()
     
     # Run scraper
-    scraper = FormattedScraper()
-    result = scraper.run_scraping(urls, output_name)
+    with FormattedScraper() as scraper:
+        result = scraper.run_scraping(urls, output_name)
     
     # Print final summary
-    print("\n" + "=" * 70)
-    print("🎉 SCRAPING COMPLETED!")
-    print("=" * 70)
-    print(f"📊 Results Summary:")
-    print(f"   ✅ Successful URLs: {result['stats']['urls_successful']}/{len(urls)}")
-    print(f"   ❌ Failed URLs: {result['stats']['urls_failed']}")
-    print(f"   📄 Total Records: {result['stats']['total_records']}")
-    print()
-    print("💾 Generated Files:")
-    print(f"   • {output_name}.csv - Main combined data")
-    print(f"   • {output_name}_table_data.csv - Table data only")
-    print(f"   • {output_name}_version_info.csv - Version information")
-    print(f"   • {output_name}_list_item.csv - List items")
-    print(f"   • {output_name}_section_content.csv - Section content")
-    print(f"   • {output_name}_summary.csv - Scraping summary report")
-    print("=" * 70)
+    stats = result['stats']
+    ext = '.csv.gz' if scraper.config.compress_output else '.csv'
+    sys.stdout.write("\n".join([
+        "",
+        rule,
+        "🎉 SCRAPING COMPLETED!",
+        rule,
+        "📊 Results Summary:",
+        f"   {EMOJI_SUCCESS} Successful URLs: {stats['urls_successful']}/{stats['urls_processed']}",
+        f"   {EMOJI_FAILURE} Failed URLs: {stats['urls_failed']}",
+        f"   📄 Total Records: {stats['total_records']}",
+        "",
+        "💾 Generated Files:",
+        f"   • {output_name}{ext} - Main combined data",
+        f"   • {output_name}_table_data{ext} - Table data only",
+        f"   • {output_name}_version_info{ext} - Version information",
+        f"   • {output_name}_list_item{ext} - List items",
+        f"   • {output_name}_section_content{ext} - Section content",
+        f"   • {output_name}_summary{ext} - Scraping summary report",
+        rule,
+    ]) + "\n")
     
     return result
 
@@ -762,26 +1365,96 @@ def quick_start():
     return run_formatted_scraper()
 
 # ==============================================================================
-# 7. LEGACY COMPATIBILITY (StaticScraper class)
+# 7. FETCHERS (legacy StaticScraper, browser-based DynamicScraper)
 # ==============================================================================
 
 class StaticScraper:
     """Legacy static scraper for compatibility."""
-    def __init__(self, url: str, config: ScraperConfig = None, logger: ScraperLogger = None):
+    def __init__(self, url: str, config: ScraperConfig = None, logger: ScraperLogger = None,
+                 client: httpx.Client = None):
         self.url = url
         self.config = config or ScraperConfig()
         self.logger = logger or ScraperLogger()
+        self.client = client  # Shared, caller-owned client; a one-off client is used without it
     
     def scrape(self) -> str:
         """Simple scrape method."""
-        import httpx
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        with httpx.Client(headers=headers, timeout=30) as client:
-            response = client.get(self.url)
+        if self.client is not None:
+            return self._get(self.client)
+        with httpx.Client(headers=DEFAULT_HEADERS, timeout=30, follow_redirects=True) as client:
+            return self._get(client)
+    
+    def _get(self, client: httpx.Client) -> str:
+        """GET the page with the given client, raising on HTTP errors."""
+        with client.stream('GET', self.url) as response:
             response.raise_for_status()
-            return response.text
+            body = bytearray()
+            for chunk in response.iter_bytes(STREAM_CHUNK_SIZE):
+                body += chunk
+                _check_body_size(self.url, len(body), self.config.max_content_size)
+        return _decode_body(response, body)
+
+# Response bodies are read in chunks of this size, so oversized pages are cut off early
+STREAM_CHUNK_SIZE = 64 * 1024
+
+def _check_body_size(url: str, size: int, limit: int):
+    """Abort a download once its body grows past the configured maximum."""
+    if size > limit:
+        raise FetchException(f"Response from {url} exceeds {limit} bytes")
+
+def _decode_body(response: httpx.Response, body: bytes) -> str:
+    """Decode a streamed body the way httpx's Response.text does."""
+    return body.decode(response.encoding or 'utf-8', errors='replace')
+
+# One Chrome instance is shared by every DynamicScraper; start-up costs seconds per driver
+_shared_driver = None
+_driver_lock = threading.Lock()
+
+def _get_shared_driver(config: ScraperConfig):
+    """Return the shared Chrome driver, starting it on first use. Call with _driver_lock held."""
+    global _shared_driver
+    if _shared_driver is None:
+        options = Options()
+        for argument in config.chrome_options:
+            options.add_argument(argument)
+        _shared_driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
+    return _shared_driver
+
+@atexit.register
+def _quit_shared_driver():
+    """Shut down the shared Chrome driver, if one was started."""
+    global _shared_driver
+    if _shared_driver is not None:
+        try:
+            _shared_driver.quit()
+        except WebDriverException:
+            pass
+        _shared_driver = None
+
+class DynamicScraper:
+    """Selenium scraper for pages that only render their content with JavaScript."""
+    def __init__(self, url: str, config: ScraperConfig = None, logger: ScraperLogger = None):
+        self.url = url
+        self.config = config or ScraperConfig()
+        self.logger = logger or ScraperLogger()
+    
+    def scrape(self) -> str:
+        """Load the page in the shared headless Chrome and return the rendered HTML."""
+        with _driver_lock:
+            try:
+                driver = _get_shared_driver(self.config)
+                driver.set_page_load_timeout(self.config.timeout)
+                driver.get(self.url)
+                WebDriverWait(driver, self.config.timeout).until(
+                    EC.presence_of_element_located((By.TAG_NAME, 'body'))
+                )
+                return driver.page_source
+            except TimeoutException as e:
+                raise FetchException(f"Browser fetch timed out for {self.url}: {e}")
+            except WebDriverException as e:
+                # The driver may have crashed; start a fresh one on the next call
+                _quit_shared_driver()
+                raise FetchException(f"Browser fetch failed for {self.url}: {e}")
 
 # ==============================================================================
 # 8. SCRIPT ENTRY POINT
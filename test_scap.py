@@ -0,0 +1,118 @@
+"""
+Regression tests for scap.py. Run with: python -m unittest test_scap
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import scap
+
+PAGE = """<html><body>
+<h1>Product Releases</h1>
+<p>The latest version 2.4.1 was released on 2024-03-15 with many fixes.</p>
+<ul><li>Improved parser speed</li><li>Fixed memory leak in module</li></ul>
+<table><tr><th>Version</th><th>Date</th></tr><tr><td>2.4.1</td><td>March 2024</td></tr></table>
+</body></html>"""
+
+_PARENT_PID = os.getpid()
+_real_parse_page = scap._parse_page
+
+def _parse_page_dying_in_worker(url, html_content, logger=None, render_check=True):
+    """Stand-in for _parse_page whose worker process dies on 'crash' pages."""
+    if 'crash' in url and os.getpid() != _PARENT_PID:
+        os._exit(1)
+    return _real_parse_page(url, html_content, logger, render_check)
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+class ParsePoolRecoveryTest(unittest.TestCase):
+    """A parse worker dying must not break later runs of the same scraper."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.site = tempfile.mkdtemp()
+        for name in ('a.html', 'b.html', 'crash.html'):
+            with open(os.path.join(cls.site, name), 'w', encoding='utf-8') as f:
+                f.write(PAGE)
+        handler = partial(_QuietHandler, directory=cls.site)
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}/"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        shutil.rmtree(cls.site)
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.out = tempfile.mkdtemp()
+        os.chdir(self.out)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.out)
+
+    def _scraper(self) -> scap.FormattedScraper:
+        scraper = scap.FormattedScraper()
+        scraper.config.parse_workers = 2
+        scraper.config.http_cache_path = None
+        self.addCleanup(scraper.close)
+        return scraper
+
+    def _assert_all_parsed(self, result, urls):
+        stats = result['stats']
+        self.assertEqual(stats['urls_successful'], len(urls))
+        self.assertEqual(stats['urls_failed'], 0)
+        self.assertGreater(stats['total_records'], 0)
+
+    def _check_worker_killed_between_runs(self, async_mode: bool):
+        urls = [self.base + 'a.html', self.base + 'b.html']
+        with mock.patch.object(scap, 'USE_ASYNC_MODE', async_mode):
+            scraper = self._scraper()
+            self._assert_all_parsed(scraper.run_scraping(urls, 'first'), urls)
+
+            broken = scraper.pool
+            with self.assertRaises(BrokenProcessPool):
+                broken.submit(os._exit, 1).result()
+
+            self._assert_all_parsed(scraper.run_scraping(urls, 'second'), urls)
+            self._assert_all_parsed(scraper.run_scraping(urls, 'third'), urls)
+            self.assertIsNotNone(scraper.pool)
+            self.assertIsNot(scraper.pool, broken)
+
+    def test_worker_killed_between_runs_sync(self):
+        self._check_worker_killed_between_runs(async_mode=False)
+
+    def test_worker_killed_between_runs_async(self):
+        self._check_worker_killed_between_runs(async_mode=True)
+
+    def _check_worker_dies_during_run(self, async_mode: bool):
+        urls = [self.base + 'a.html', self.base + 'crash.html', self.base + 'b.html']
+        with mock.patch.object(scap, 'USE_ASYNC_MODE', async_mode), \
+                mock.patch.object(scap, '_parse_page', _parse_page_dying_in_worker):
+            scraper = self._scraper()
+            self._assert_all_parsed(scraper.run_scraping(urls, 'first'), urls)
+
+        # The next run gets a working pool again
+        with mock.patch.object(scap, 'USE_ASYNC_MODE', async_mode):
+            self._assert_all_parsed(scraper.run_scraping(urls[::2], 'second'), urls[::2])
+
+    def test_worker_dies_during_run_sync(self):
+        self._check_worker_dies_during_run(async_mode=False)
+
+    def test_worker_dies_during_run_async(self):
+        self._check_worker_dies_during_run(async_mode=True)
+
+if __name__ == '__main__':
+    unittest.main()